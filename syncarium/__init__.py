@@ -11,8 +11,45 @@
 """
 
 
-from .tui import TuiApp
-from .core import PlatInit, SyncCore, LoadGen, DataEx
-from .utils import ViewTools
+import importlib
+from typing import Any
 
 __version__ = '1.0.0'
+
+# Public names and the submodule providing each one. They are imported on
+# first access (PEP 562) so `import syncarium` does not pull in the TUI stack.
+_LAZY: dict[str, str] = {
+    "TuiApp": ".tui",
+    "PlatInit": ".core",
+    "SyncCore": ".core",
+    "LoadGen": ".core",
+    "DataEx": ".core",
+    "ViewTools": ".utils",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Imports a lazily exported name on first access and caches it.
+
+    ### Args
+    - **name** (`str`): Attribute requested from the package.
+
+    ### Raises
+    - **AttributeError**: If `name` is not a lazily exported attribute.
+    """
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """
+    Lists the module attributes, including lazy exports not yet imported.
+    """
+    return sorted(set(globals()) | set(__all__))
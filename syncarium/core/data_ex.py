@@ -14,16 +14,19 @@
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Standard Library Imports
+import os
+import io
+import re
 import csv
+import json
 import threading
 import multiprocessing
 import queue
-import yaml
 import time
 import datetime
 import signal
 from pathlib import Path
-from typing import Optional, List, Dict, Any, Callable
+from typing import Optional, List, Dict, Any, Callable, TextIO
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Third-Party Imports
@@ -36,6 +39,73 @@ import syncarium.core.dsources as dsources
 import syncarium.options.global_vars as global_vars
 
 
+# Characters that force a CSV field to be quoted
+_CSV_SPECIAL_RE = re.compile(r'[,"\r\n]')
+
+
+# ─────────────────────────────────────────────────────────────
+# 📌 Function: _format_metric_row
+# ─────────────────────────────────────────────────────────────
+def _format_metric_row(timestamp: Any, metric: Any, value: Any) -> bytes:
+    """
+    Formats a metric as an encoded CSV row.
+
+    Rows are built directly with a format string; the `csv` module is only used
+    when the metric name or value contains characters that require quoting.
+    The output is identical to `csv.writer` with its default dialect.
+
+    ### Args
+    - **timestamp** (`Any`): Time the metric was recorded.
+    - **metric** (`Any`): Full name of the metric.
+    - **value** (`Any`): Value of the metric (`None` is written as an empty field).
+
+    ### Returns
+    - **bytes**: UTF-8 encoded row, terminated by `\r\n`.
+    """
+    metric = str(metric)
+    value = "" if value is None else str(value)
+
+    if _CSV_SPECIAL_RE.search(metric) or _CSV_SPECIAL_RE.search(value):
+        buffer = io.StringIO()
+        csv.writer(buffer).writerow((timestamp, metric, value))
+        return buffer.getvalue().encode()
+
+    return f"{timestamp},{metric},{value}\r\n".encode()
+
+
+# Summary keys that can be written unquoted
+_YAML_PLAIN_KEY_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_-]*')
+_YAML_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+
+
+# ─────────────────────────────────────────────────────────────
+# 📌 Function: _emit_summary
+# ─────────────────────────────────────────────────────────────
+def _emit_summary(file: TextIO, data: Dict[str, Any], level: int = 0) -> None:
+    """
+    Writes the extractor summary as block-style YAML without going through `yaml.dump`.
+
+    Nested dictionaries become indented mappings and every other value is written
+    as a JSON scalar or flow sequence, which YAML parsers read back unchanged.
+
+    ### Args
+    - **file** (`TextIO`): Open text file to write to.
+    - **data** (`Dict[str, Any]`): Mapping to emit.
+    - **level** (`int`): Nesting level of `data`. Defaults to `0`.
+    """
+    indent = "  " * level
+    for key, value in data.items():
+        key = str(key)
+        if not _YAML_PLAIN_KEY_RE.fullmatch(key) or key.lower() in _YAML_RESERVED_WORDS:
+            key = json.dumps(key, ensure_ascii=False)
+
+        if isinstance(value, dict) and value:
+            file.write(f"{indent}{key}:\n")
+            _emit_summary(file, value, level + 1)
+        else:
+            file.write(f"{indent}{key}: {json.dumps(value, ensure_ascii=False, default=str)}\n")
+
+
 # ─────────────────────────────────────────────────────────────
 # 📈 DataEx Class
 # ─────────────────────────────────────────────────────────────
@@ -47,12 +117,23 @@ class DataEx:
     - **vt** (`utils.ViewTools`): Utility tools for view-related operations.
     - **output_dir** (`Path`): Directory where output files will be stored.
     - **loaded_datasources** (`List[dsources.DataSource]`): List of data sources that have been loaded.
-    - **writer_process** (`multiprocessing.Process`): Background process responsible for writing output.
+    - **writer_process** (`Optional[multiprocessing.Process]`): Background process responsible for writing output, if one was started.
     - **output_filepath** (`Optional[Path]`): Path to the output file, if available.
     - **start_time** (`Optional[float]`): Timestamp marking the start of the extraction process.
     - **duration** (`Optional[int]`): Duration of the extraction process in seconds.
+    - **WRITE_BUFFER_SIZE** (`int`): Buffer size in bytes of the output CSV file.
+    - **WRITE_BATCH_SIZE** (`int`): Number of rows written to the CSV file at once.
+    - **WRITE_FLUSH_INTERVAL** (`float`): Maximum time in seconds rows stay pending before being written.
+    - **ALIVE_CACHE_TTL** (`float`): Time in seconds a writer process liveness check is reused.
+    - **METRIC_QUEUE_SIZE** (`int`): Maximum number of metrics pending to be written; newer ones are dropped.
     """
 
+    WRITE_BUFFER_SIZE: int = 1 << 20
+    WRITE_BATCH_SIZE: int = 256
+    WRITE_FLUSH_INTERVAL: float = 1.0
+    ALIVE_CACHE_TTL: float = 0.1
+    METRIC_QUEUE_SIZE: int = 16384
+
     # ─────────────────────────────────────────────────────────────
     # 🚧 Constructor
     # ─────────────────────────────────────────────────────────────
@@ -74,8 +155,11 @@ class DataEx:
         # Initialize the list of loaded data sources
         self.loaded_datasources: List[dsources.DataSource] = []
 
-        # Prepare the writer process (not started yet)
-        self.writer_process: multiprocessing.Process = multiprocessing.Process()
+        # The writer process is only created when an extraction starts
+        self.writer_process: Optional[multiprocessing.Process] = None
+
+        # Last liveness check of the writer process as (monotonic time, alive)
+        self._alive_cache: Optional[tuple[float, bool]] = None
 
         # Initialize metadata for output tracking
         self.output_filepath: Optional[Path] = None
@@ -83,6 +167,30 @@ class DataEx:
         self.duration: Optional[int] = None
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: is_running
+# ─────────────────────────────────────────────────────────────────────────────
+    def is_running(self) -> bool:
+        """
+        Checks whether the writer process has been started and is still alive.
+
+        The result is reused for `ALIVE_CACHE_TTL` seconds so that repeated checks
+        during a menu render do not each issue a `waitpid` system call.
+
+        ### Returns
+        - **bool**: `True` if an extraction is in progress, `False` otherwise.
+        """
+
+        if self.writer_process is None:
+            return False
+
+        now = time.monotonic()
+        if self._alive_cache is None or now - self._alive_cache[0] > self.ALIVE_CACHE_TTL:
+            self._alive_cache = (now, self.writer_process.is_alive())
+
+        return self._alive_cache[1]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 📋 Function: main_menu
 # ─────────────────────────────────────────────────────────────────────────────
@@ -129,6 +237,7 @@ class DataEx:
                 # Show extractor status and output information
                 self.vt.table_data_extractor(
                     self.writer_process,
+                    self.is_running(),
                     self.loaded_datasources,
                     self.output_filepath,
                     self.start_time,
@@ -202,7 +311,7 @@ class DataEx:
         if not quiet: self.vt.console_message("title", "Data Sources Configuration", "🛢️")
 
         # Prevent loading if extractor is running
-        if self.writer_process.is_alive():
+        if self.is_running():
             self.vt.console_message("info", "Data extractor is running already.", indent=1)
             return
 
@@ -216,7 +325,12 @@ class DataEx:
             filepath_cfg: Path = file_cfg
         
         else:
-            config_files = [f.name for f in Path(self.datasources_dir).glob("*.yaml")]
+            try:
+                with os.scandir(self.datasources_dir) as entries:
+                    config_files = [e.name for e in entries if e.name.endswith(".yaml") and e.is_file()]
+            except FileNotFoundError:
+                # A missing directory is reported like an empty one
+                config_files = []
 
             if not config_files:
                 self.vt.console_message("error", f"No data sources files found in '{self.datasources_dir}'.", indent=1)
@@ -240,53 +354,42 @@ class DataEx:
                 self.vt.console_message("caution", "Operation cancelled by user.")
                 return
             
-        # Load YAML configuration
-        with open(filepath_cfg, 'r') as file:
-            yaml_data = yaml.safe_load(file)
-            data = yaml_data.get("dataex_datasources", {})
+        # Load YAML configuration (re-parsed only when the file changes)
+        yaml_data = utils.parse_config(str(filepath_cfg), Path(filepath_cfg).stat().st_mtime_ns)
+        data = yaml_data.get("dataex_datasources", {})
 
         # Parse each data source entry
         for source_name, source_info in data.items():
             try:
-                data_class = source_info.pop('data_class')
+                data_class = source_info['data_class']
+                source_class = dsources.DATASOURCE_REGISTRY.get(data_class)
+
+                if source_class is None:
+                    if not quiet: self.vt.console_message("error", f"Unknown Data Source: {data_class}", indent=1)
+                    continue
+
+                if not quiet: self.vt.console_message("info", f"Loading {data_class} config: {source_name}", indent=1)
 
-                if data_class == 'FileLogDataSource':
-                    if not quiet: self.vt.console_message("info", f"Loading FileLogDataSource config: {source_name}", indent=1)
+                args = {arg: source_info[arg] for arg in source_class.REQUIRED_ARGS}
+                args.update({arg: source_info[arg] for arg in source_class.OPTIONAL_ARGS if arg in source_info})
 
-                    log_path = global_vars.LOG_DIR / Path(source_info["filepath"])
+                # Log files are relative to the log directory and created if missing
+                if source_class is dsources.FileLogDataSource:
+                    log_path = global_vars.LOG_DIR / Path(args["filepath"])
                     if not log_path.is_file():
                         if not quiet: 
                             self.vt.console_message("error", f"Log file not found: {log_path}", indent=2)
                             self.vt.console_message("info", f"Creating log file: {log_path}", indent=2)
                         log_path.parent.mkdir(parents=True, exist_ok=True)
                         log_path.touch()
+                    args["filepath"] = str(log_path)
 
-                    self.loaded_datasources.append({
-                        "class": dsources.FileLogDataSource,
-                        "name": source_name,
-                        "args": {
-                            "pattern": source_info["pattern"],
-                            "filepath": str(log_path)
-                        }
-                    })
-                    if not quiet: self.vt.console_message("success", f"Loaded FileLogDataSource config: {source_name}", indent=2)
-
-                elif data_class == "PPSAnalyzerDataSource":
-                    if not quiet: self.vt.console_message("info", f"Loading PPSAnalyzerDataSource config: {source_name}", indent=1)
-
-                    self.loaded_datasources.append({
-                        "class": dsources.PPSAnalyzerDataSource,
-                        "name": source_name,
-                        "args": {
-                            "serial_port": source_info["serial_port"],
-                            "pps_inputs": source_info["pps_inputs"],
-                            "cable_delays": source_info["cable_delays"],
-                        }
-                    })
-                    if not quiet: self.vt.console_message("success", f"Loaded PPSAnalyzerDataSource config: {source_name}", indent=2)
-
-                else:
-                    if not quiet: self.vt.console_message("error", f"Unknown Data Source: {data_class}", indent=1)
+                self.loaded_datasources.append({
+                    "class": source_class,
+                    "name": source_name,
+                    "args": args
+                })
+                if not quiet: self.vt.console_message("success", f"Loaded {data_class} config: {source_name}", indent=2)
 
             except Exception as e:
                 if not quiet: self.vt.console_message("error", f"Error loading {source_name} ({data_class}): {e}", indent=1)
@@ -331,7 +434,7 @@ class DataEx:
         """
 
         # Prevent starting if a writer process is already running
-        if self.writer_process.is_alive():
+        if self.is_running():
             self.vt.console_message(
                 "caution",
                 f"A writer process is already running with PID {self.writer_process.pid}.",
@@ -382,24 +485,12 @@ class DataEx:
         output_filepath.parent.mkdir(exist_ok=True, parents=True)
         self.output_filepath = str(output_filepath)
 
-        # Prepare data source configurations for the writer process
-        source_configs = [
-            {
-                "class": source["class"],
-                "name": source["name"],
-                "args": source["args"]
-            }
-            for source in self.loaded_datasources
-        ]
+        # Loaded data sources are already in the form expected by the writer process
+        source_configs = self.loaded_datasources
 
         # Save extractor parameters to a YAML file
         extractor_output = {
-            "datasources": {
-                source["name"]: {
-                    "args": source["args"]
-                }
-                for source in self.loaded_datasources
-            },
+            "datasources": {source["name"]: {"args": source["args"]} for source in source_configs},
             "duration": self.duration,
             "started_at": start_time_hr,
             "finished_at_planned": planned_end_time_hr
@@ -407,7 +498,7 @@ class DataEx:
 
         extractor_output_filepath = self.output_dir / f"{suffix}.yaml"
         with open(extractor_output_filepath, "w") as file:
-            yaml.dump(extractor_output, file, sort_keys=False, default_flow_style=False, allow_unicode=True)
+            _emit_summary(file, extractor_output)
 
         # Launch the writer process
         self.writer_process = multiprocessing.Process(
@@ -415,6 +506,7 @@ class DataEx:
             args=(output_filepath, extractor_output_filepath, duration, source_configs)
         )
         self.writer_process.start()
+        self._alive_cache = None
 
         # Display confirmation and process details
         self.vt.console_message("success", "DataEx launched successfully.", indent=1+extra_indent, logger=logger)
@@ -451,6 +543,7 @@ class DataEx:
 
         ### Notes
         - Each data source runs in its own thread and pushes metrics to a shared queue.
+        - Rows are written in batches and flushed at least once per `WRITE_FLUSH_INTERVAL`.
         - The process ignores `SIGINT` to prevent interruption via keyboard.
         - Graceful termination is supported via `SIGTERM`.
         - Metadata including the stop time is appended to the YAML file after extraction ends.
@@ -467,7 +560,7 @@ class DataEx:
 
         # Shared event and queue for thread coordination
         event = threading.Event()
-        q: queue.Queue = queue.Queue(maxsize=1000)
+        q: queue.Queue = queue.Queue(maxsize=self.METRIC_QUEUE_SIZE)
 
         sources = []
         for config in source_configs:
@@ -487,21 +580,43 @@ class DataEx:
                     logger=logger
                 )
 
-        # Open CSV file and write header
-        with output_filepath.open("w", newline="", buffering=1) as file:
-            writer = csv.writer(file)
-            writer.writerow(["timestamp", "metric", "value"])
+        # Open CSV file with a large buffer and write header
+        with output_filepath.open("wb", buffering=self.WRITE_BUFFER_SIZE) as file:
+            file.write(b"timestamp,metric,value\r\n")
+
+            # Encoded rows pending to be written to the CSV file
+            rows: List[bytes] = []
+            last_flush = time.monotonic()
+
+            # Trigger the event when the duration expires
+            timer = threading.Timer(duration, event.set)
+            timer.daemon = True
+            timer.start()
 
             try:
                 # Collect data until duration expires or event is triggered
-                t_end = time.time() + duration
-                while time.time() < t_end and not event.is_set():
+                while not event.is_set():
                     try:
-                        timestamp, metric, value = q.get(timeout=1)
-                        writer.writerow([timestamp, metric, value])
+                        # Wait for one metric, then drain what is already queued
+                        rows.append(_format_metric_row(*q.get(timeout=1)))
+                        while len(rows) < self.WRITE_BATCH_SIZE:
+                            rows.append(_format_metric_row(*q.get_nowait()))
                     except queue.Empty:
-                        continue  # No data available, continue waiting
+                        pass  # No more data available, check whether to flush
+
+                    # Write rows in batches, at least once per flush interval
+                    now = time.monotonic()
+                    if len(rows) >= self.WRITE_BATCH_SIZE or (rows and now - last_flush >= self.WRITE_FLUSH_INTERVAL):
+                        file.write(b"".join(rows))
+                        file.flush()
+                        rows.clear()
+                        last_flush = now
             finally:
+                timer.cancel()
+
+                # Write any pending rows
+                file.write(b"".join(rows))
+
                 # Signal all threads to stop
                 event.set()
                 for source in sources:
@@ -515,7 +630,7 @@ class DataEx:
                     "finished_at": stop_time_hr,
                 }
                 with extractor_output_filepath.open("a") as file:
-                    yaml.dump(extractor_output, file, sort_keys=False, default_flow_style=False, allow_unicode=True)
+                    _emit_summary(file, extractor_output)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -544,7 +659,7 @@ class DataEx:
         self.vt.console_message("title", "Stopping extraction", "🛑", logger=logger, indent=extra_indent)
 
         # Check if the writer process is running
-        if not self.writer_process.is_alive():
+        if not self.is_running():
             self.vt.console_message("info", "No DataEx running.", indent=1 + extra_indent, logger=logger)
             return
 
@@ -556,10 +671,11 @@ class DataEx:
                 return
 
         # Terminate the writer process if still alive
-        if self.writer_process.is_alive():
+        if self.is_running():
             self.vt.console_message("clean", "Terminating writer process...", indent=1 + extra_indent, logger=logger)
             self.writer_process.terminate()
             self.writer_process.join()
+            self._alive_cache = None
             self.vt.console_message("success", "Writer process forcefully terminated.", indent=1 + extra_indent, logger=logger)
         else:
             self.vt.console_message("info", "Writer process is not running.", indent=1 + extra_indent, logger=logger)
@@ -587,7 +703,7 @@ class DataEx:
         self.vt.console_message("title", "Showing progress", "⏳")
 
         # Check if extraction is active
-        if not self.writer_process.is_alive():
+        if not self.is_running():
             self.vt.console_message("caution", "No data extraction was started.", indent=1)
             return
 
@@ -607,7 +723,7 @@ class DataEx:
         """
 
         # Check if extraction is active
-        if not self.writer_process.is_alive():
+        if not self.is_running():
             self.vt.console_message("caution", "No data extraction was started.", indent=1)
             return
 
@@ -18,4 +18,10 @@ from .ppsanalyzer import PPSAnalyzerDataSource
 #from .relyum import RelyumDataSource
 #from .counter import CounterDataSource
 
+# Data source classes available to the data extractor, by configuration name
+DATASOURCE_REGISTRY: dict[str, type[DataSource]] = {
+    "FileLogDataSource": FileLogDataSource,
+    "PPSAnalyzerDataSource": PPSAnalyzerDataSource,
+}
+
 __version__ = '1.0.0'
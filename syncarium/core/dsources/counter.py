@@ -1,9 +1,8 @@
 """Frequency counter data source."""
 
-import multiprocessing as mp
-import signal
+import queue
+import threading
 import time
-from multiprocessing.synchronize import Event as _EventType
 
 import pyvisa as visa
 from pyvisa.resources import MessageBasedResource
@@ -24,16 +23,17 @@ class CounterDataSource(DataSource):
 # ─────────────────────────────────────────────────────────────────────────────
 # 🚧 Function: constructor
 # ─────────────────────────────────────────────────────────────────────────────
-    def __init__(self, queue: mp.Queue, event: _EventType, resource_name: str) -> None:
+    def __init__(self, name: str, queue: queue.Queue, event: threading.Event, resource_name: str) -> None:
         """
         Initializes a `CounterDataSource` with a specific VISA resource name.
 
         ### Args
-        - **queue** (`mp.Queue`): Queue used to send metrics.
-        - **event** (`_EventType`): Event used to signal thread termination.
+        - **name** (`str`): Identifier for the data source.
+        - **queue** (`queue.Queue`): Queue used to send metrics.
+        - **event** (`threading.Event`): Event used to signal thread termination.
         - **resource_name** (`str`): VISA resource identifier of the frequency counter.
         """
-        super().__init__(queue, event)
+        super().__init__(name, queue, event)
         self.resource_name = resource_name
 
 
@@ -47,8 +47,6 @@ class CounterDataSource(DataSource):
         The method configures the instrument using VISA commands and reads timestamped
         measurements until the stop event is triggered.
         """
-        signal.signal(signal.SIGINT, signal.SIG_IGN)
-
         rm = visa.ResourceManager()
         instr = rm.open_resource(self.resource_name)
 
@@ -56,6 +54,7 @@ class CounterDataSource(DataSource):
             instr.read_termination = "\n"
             instr.write_termination = "\n"
             instr.timeout = 10 * 1e3
+            instr.chunk_size = 102400
 
             instr.write("*RST")
             instr.write("SYST:TIM 2.0E0")
@@ -63,11 +62,14 @@ class CounterDataSource(DataSource):
             instr.write("INP1:COUP DC; IMP 50; RANG 5; LEV 2.0; SLOP NEG")
             instr.write("INP2:COUP DC; IMP 50; RANG 5; LEV 1.5; SLOP POS")
 
-            while not self.event.is_set():
-                instr.query("*OPC?")
-                value = instr.query("READ?")
-                timestamp = time.time_ns()
-                self._send_metric(timestamp, "offset_hw", value)
+            # Bind per-sample callables once for the acquisition loop
+            query, time_ns, send_metric, is_set = instr.query, time.time_ns, self.send_metric, self.event.is_set
+
+            while not is_set():
+                # Both queries in one transaction, the reply is "<opc>;<reading>"
+                value = float(query("*OPC?;:READ?").rsplit(";", 1)[-1])
+                timestamp = time_ns()
+                send_metric(timestamp, "offset_hw", value)
         else:
             raise ValueError("Instrument is not a message-based resource")
 
@@ -14,6 +14,7 @@
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Standard Library Imports
+import os
 import threading
 import queue
 from typing import Any
@@ -42,8 +43,14 @@ class DataSource(threading.Thread):
     - **name** (`str`): Identifier for the data source.
     - **queue** (`queue.Queue`): Shared queue to which metrics are sent.
     - **event** (`threading.Event`): Event used to signal when the thread should stop.
+    - **dropped** (`int`): Metrics discarded because the queue was full, not yet reported.
+    - **REQUIRED_ARGS** (`tuple[str, ...]`): Configuration keys always passed to the constructor.
+    - **OPTIONAL_ARGS** (`tuple[str, ...]`): Configuration keys passed to the constructor only when present.
     """
 
+    REQUIRED_ARGS: tuple[str, ...] = ()
+    OPTIONAL_ARGS: tuple[str, ...] = ()
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 🚧 Function: constructor
 # ─────────────────────────────────────────────────────────────────────────────
@@ -60,6 +67,7 @@ class DataSource(threading.Thread):
         self.name = name
         self.queue = queue
         self.event = event
+        self.dropped = 0
         self.daemon = True
 
 
@@ -70,16 +78,67 @@ class DataSource(threading.Thread):
         """
         Sends a metric to the shared queue with a timestamp and a formatted name.
 
+        The metric is dropped if the queue is full, so a stalled consumer never
+        blocks the source. Dropped metrics are counted and reported as
+        `dropped_metrics_<name>` once the queue accepts metrics again.
+
         ### Args
         - **timestamp** (`float`): Time the metric was recorded.
         - **name** (`str`): Base name of the metric.
         - **value** (`Any`): Value of the metric.
         """
         full_name = f"{name}_{self.name}"
-        self.queue.put((timestamp, full_name, value))
+        try:
+            self.queue.put_nowait((timestamp, full_name, value))
+        except queue.Full:
+            self.dropped += 1
+            return
+
+        if self.dropped:
+            try:
+                self.queue.put_nowait((timestamp, f"dropped_metrics_{self.name}", self.dropped))
+                self.dropped = 0
+            except queue.Full:
+                # The metric itself was delivered, retry the report on the next call
+                pass
         # Metrics could also be forwarded to Prometheus, InfluxDB, MQTT, etc.
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: set_realtime
+# ─────────────────────────────────────────────────────────────────────────────
+    def set_realtime(self, cpu: int, priority: int = 50) -> bool:
+        """
+        Pins the calling thread to a CPU and schedules it with `SCHED_FIFO`.
+
+        Must be called from the thread itself (e.g. at the start of `run`).
+        Best effort: a setting the platform does not support, or the process lacks
+        the privileges for (`CAP_SYS_NICE` for `SCHED_FIFO`), is reported and skipped.
+
+        ### Args
+        - **cpu** (`int`): CPU the thread is allowed to run on.
+        - **priority** (`int`, optional): Real-time priority (1-99). Defaults to 50.
+
+        ### Returns
+        - **bool**: `True` if both settings were applied, `False` otherwise.
+        """
+        applied = True
+
+        try:
+            os.sched_setaffinity(0, {cpu})
+        except (AttributeError, OSError) as e:
+            print(f"[{self.name}] ⚠️ Error: could not pin to CPU {cpu}: {e}")
+            applied = False
+
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+        except (AttributeError, OSError) as e:
+            print(f"[{self.name}] ⚠️ Error: could not set SCHED_FIFO priority {priority}: {e}")
+            applied = False
+
+        return applied
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: stop
 # ─────────────────────────────────────────────────────────────────────────────
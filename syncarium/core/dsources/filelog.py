@@ -43,8 +43,11 @@ class FileLogDataSource(DataSource):
     ### Attributes
     - **pattern** (`Pattern`): Compiled regex pattern used to extract metrics.
     - **filepath** (`str`): Path to the log file being monitored.
+    - **REQUIRED_ARGS** (`tuple[str, ...]`): Configuration keys required to build the data source.
     """
 
+    REQUIRED_ARGS: tuple[str, ...] = ("pattern", "filepath")
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 🚧 Function: constructor
 # ─────────────────────────────────────────────────────────────────────────────
@@ -100,15 +103,18 @@ class FileLogDataSource(DataSource):
         as timestamped metrics to the shared queue.
         """
         try:
+            # Bind per-line callables once for the follow loop
+            search, time_ns, send_metric = self.pattern.search, time.time_ns, self.send_metric
+
             with open(self.filepath, 'r', encoding='utf-8') as file:
                 for line in self.follow(file):
-                    match = self.pattern.search(line)
+                    match = search(line)
                     if not match:
                         continue
 
-                    timestamp = time.time_ns()
+                    timestamp = time_ns()
                     for name, value in match.groupdict().items():
-                        self.send_metric(timestamp, name, value)
+                        send_metric(timestamp, name, value)
         except Exception as e:
             print(f"[{self.name}] ⚠️ Error: {e}")
 
@@ -27,10 +27,13 @@ See [http://www.gnu.org/licenses/](http://se details.
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Standard Library Imports
+import os
+import re
 import time
+import select
 import queue
+import operator
 import threading
-from datetime import datetime, timedelta
 from typing import List
 from functools import reduce
 
@@ -62,9 +65,23 @@ class PPSAnalyzerDataSource(DataSource):
     - **pps_inputs** (`List[int]`): List of active PPS input indices.
     - **cable_delays** (`List[int]`): Cable delay values (in nanoseconds) for each input.
     - **tsu_state** (`List[bool]`): Active/inactive state of each TSU.
+    - **enabled_tsus** (`set[int]`): Indices of the currently enabled TSUs.
     - **base_addrs** (`List[int]`): Base memory addresses for each TSU.
+    - **cpu_affinity** (`int | None`): CPU the polling thread is pinned to, if any.
+    - **REQUIRED_ARGS** (`tuple[str, ...]`): Configuration keys required to build the data source.
+    - **OPTIONAL_ARGS** (`tuple[str, ...]`): Configuration keys passed only when present.
+    - **CYCLE_NS** (`int`): Polling period of the TSUs, in nanoseconds.
+    - **HEX_ZERO**, **HEX_ONE** (`str`): Register values 0 and 1 formatted for the UART protocol.
+    - **RESPONSE_RE** (`re.Pattern`): Response frame `$CONTENT*CHK`, capturing content and checksum.
     """
 
+    REQUIRED_ARGS: tuple[str, ...] = ("serial_port", "pps_inputs", "cable_delays")
+    OPTIONAL_ARGS: tuple[str, ...] = ("cpu_affinity",)
+    CYCLE_NS: int = 500_000_000
+    HEX_ZERO: str = "0x00000000"
+    HEX_ONE: str = "0x00000001"
+    RESPONSE_RE: re.Pattern = re.compile(r"\$([^*]*)\*([0-9A-F]{2})")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 🚧 Function: constructor
@@ -76,7 +93,8 @@ class PPSAnalyzerDataSource(DataSource):
         event: threading.Event,
         serial_port: str = "/dev/ttyUSB1",
         pps_inputs: List[int] | None = None,
-        cable_delays: List[int] | None = None
+        cable_delays: List[int] | None = None,
+        cpu_affinity: int | None = None
     ) -> None:
         """
         Initializes a `PPSAnalyzerDataSource` instance with configuration for PPS hardware.
@@ -88,6 +106,7 @@ class PPSAnalyzerDataSource(DataSource):
         - **serial_port** (`str`, optional): Serial port for UART communication. Defaults to `"/dev/ttyUSB1"`.
         - **pps_inputs** (`List[int]`, optional): List of active PPS input indices. Defaults to all TSUs.
         - **cable_delays** (`List[int]`, optional): Cable delay values (in nanoseconds). Defaults to zero delay.
+        - **cpu_affinity** (`int`, optional): CPU to pin the polling thread to, with real-time priority. Defaults to no pinning.
 
         ### Raises
         - **ValueError**: If `pps_inputs` and `cable_delays` have mismatched lengths.
@@ -111,7 +130,11 @@ class PPSAnalyzerDataSource(DataSource):
         }
 
         self.port = serial_port
+        self.cpu_affinity = cpu_affinity
         self.uart = None  # UART interface will be initialized later
+        self._fd = None  # File descriptor of the open UART
+        self._rx_buf = bytearray()  # Received bytes not yet consumed as a frame
+        self._frames: dict[tuple[str, tuple[str, ...]], bytes] = {}  # Encoded command frames already built
 
         # Use all TSUs by default if no specific PPS inputs are provided
         self.pps_inputs = pps_inputs if pps_inputs is not None else list(range(self.NUM_TSU))
@@ -125,10 +148,21 @@ class PPSAnalyzerDataSource(DataSource):
 
         # Track the active/inactive state of each TSU
         self.tsu_state = [False] * self.NUM_TSU
+        self.enabled_tsus: set[int] = set()
 
         # Compute base memory addresses for each TSU
         self.base_addrs = [0x10000000 * (i + 1) for i in range(self.NUM_TSU)]
 
+        # Precompute the hex-formatted register addresses of each TSU (indexed by TSU)
+        hex_addrs = lambda reg: [f"0x{base + self.REG[reg]:08X}" for base in self.base_addrs]
+        self._hex_enable = hex_addrs("ENABLE")
+        self._hex_cable_delay = hex_addrs("CABLE_DELAY")
+        self._hex_int_clear = hex_addrs("INT_CLEAR")
+        self._hex_int_enable = hex_addrs("INT_ENABLE")
+        self._hex_event_count = hex_addrs("EVENT_COUNT")
+        self._hex_ts_ns = hex_addrs("TS_NS")
+        self._hex_ts_s = hex_addrs("TS_S")
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: _checksum
@@ -143,13 +177,39 @@ class PPSAnalyzerDataSource(DataSource):
         ### Returns
         - **str**: Two-character hexadecimal checksum string (zero-padded).
         """
-        return format(reduce(lambda x, y: x ^ ord(y), data, 0), 'X').zfill(2)
+        # XOR over the raw bytes with a C-level operator (no per-char lambda/ord calls)
+        return f"{reduce(operator.xor, data.encode('ascii'), 0):02X}"
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _frame
+# ─────────────────────────────────────────────────────────────────────────────
+    def _frame(self, code: str, fields: tuple[str, ...]) -> bytes:
+        """
+        Builds the encoded UART frame of a command, including its checksum.
+
+        Frames are cached per command, since the polling loop keeps sending
+        the same register reads and writes.
+
+        ### Args
+        - **code** (`str`): Command code to send.
+        - **fields** (`tuple[str, ...]`): Fields to include in the command.
+
+        ### Returns
+        - **bytes**: Frame in the form `$CODE,FIELDS*CHK\\r\\n`.
+        """
+
+        key = (code, fields)
+        frame = self._frames.get(key)
+        if frame is None:
+            payload = f"{code},{','.join(fields)}" if fields else code
+            frame = self._frames[key] = f"${payload}*{self._checksum(payload)}\r\n".encode()
+        return frame
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: _comm
 # ─────────────────────────────────────────────────────────────────────────────
-    def _comm(self, code: str, fields: List[str] = [], tries: int = 2) -> List[str]:
+    def _comm(self, code: str, fields: tuple[str, ...] = (), tries: int = 2) -> List[str]:
         """
         Sends a command to the PPS device over UART and parses the response.
 
@@ -158,7 +218,7 @@ class PPSAnalyzerDataSource(DataSource):
 
         ### Args
         - **code** (`str`): Command code to send.
-        - **fields** (`List[str]`, optional): List of fields to include in the command.
+        - **fields** (`tuple[str, ...]`, optional): Fields to include in the command.
         - **tries** (`int`, optional): Number of retry attempts in case of failure. Defaults to 2.
 
         ### Returns
@@ -168,29 +228,59 @@ class PPSAnalyzerDataSource(DataSource):
         - **Exception**: If communication fails or response is invalid after all retries.
         """
 
+        return self._comm_many([(code, fields)], tries)[0]
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _comm_many
+# ─────────────────────────────────────────────────────────────────────────────
+    def _comm_many(self, commands: List[tuple[str, tuple[str, ...]]], tries: int = 2) -> List[List[str]]:
+        """
+        Sends several commands to the PPS device in a single UART write.
+
+        All command frames are written back to back and the responses are read
+        in the same order, so a batch costs one round trip instead of one per
+        command. Retries the whole batch if any response is invalid.
+
+        ### Args
+        - **commands** (`List[tuple[str, tuple[str, ...]]]`): `(code, fields)` pairs to send.
+        - **tries** (`int`, optional): Number of retry attempts in case of failure. Defaults to 2.
+
+        ### Returns
+        - **List[List[str]]**: Parsed fields of each response, in command order.
+
+        ### Raises
+        - **Exception**: If communication fails or a response is invalid after all retries.
+        """
+
+        # Bind the per-frame helpers once for the response loop
+        frame, recv_frame, checksum = self._frame, self._recv_frame, self._checksum
+        match_response = self.RESPONSE_RE.fullmatch
+
         for attempt in range(tries):
             try:
-                # Construct the command string with checksum
-                payload = f"{code}{',' if fields else ''}{','.join(fields)}"
-                checksum = self._checksum(payload)
-                tx = f"${payload}*{checksum}\r\n"
-                self.uart.write(tx.encode())
+                # Send every command frame in a single write
+                self.uart.write(b"".join([frame(code, fields) for code, fields in commands]))
 
-                # Read and decode the response
-                rx = self.uart.readline().decode().strip()
-                if not rx.startswith('$'):
-                    raise Exception("Invalid response format")
+                responses = []
+                append = responses.append
+                for _ in commands:
+                    # Read and decode the response
+                    match = match_response(recv_frame())
+                    if match is None:
+                        raise Exception("Invalid response format")
 
-                # Split and validate checksum
-                content, received_chk = rx[1:].split("*")
-                if received_chk != self._checksum(content):
-                    raise Exception("Checksum mismatch")
+                    # Validate checksum
+                    content, received_chk = match.groups()
+                    if received_chk != checksum(content):
+                        raise Exception("Checksum mismatch")
 
-                parts = content.split(',')
-                if parts[0] == "ER":
-                    raise Exception("Device returned an error")
+                    parts = content.split(',')
+                    if parts[0] == "ER":
+                        raise Exception("Device returned an error")
 
-                return parts[1:]
+                    append(parts[1:])
+
+                return responses
 
             except Exception:
                 if attempt == tries - 1:
@@ -198,7 +288,65 @@ class PPSAnalyzerDataSource(DataSource):
 
                 # Reinitialize UART before retrying
                 self.uart.close()
-                self.uart = serial.Serial(port=self.port, baudrate=1000000, timeout=3)
+                self._open_uart()
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _open_uart
+# ─────────────────────────────────────────────────────────────────────────────
+    def _open_uart(self) -> None:
+        """
+        Opens the UART connection, resets the receive buffer and, when the
+        adapter supports it, sets its latency timer to 1 ms.
+        """
+
+        self.uart = serial.Serial(port=self.port, baudrate=1000000, timeout=3)
+        self._fd = self.uart.fileno()
+        self._rx_buf.clear()
+
+        # Lower the USB-serial latency timer (FTDI defaults to 16 ms) to 1 ms.
+        # Best effort: not every adapter exposes it and it may need privileges.
+        tty = os.path.basename(os.path.realpath(self.port))
+        try:
+            with open(f"/sys/bus/usb-serial/devices/{tty}/latency_timer", "w") as file:
+                file.write("1")
+        except OSError:
+            pass
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _recv_frame
+# ─────────────────────────────────────────────────────────────────────────────
+    def _recv_frame(self, timeout: float = 3.0) -> str:
+        """
+        Reads one CRLF-terminated response frame from the UART.
+
+        Waits on the file descriptor with `select` and reads whatever is
+        available in bulk, instead of pyserial's byte-by-byte `readline`.
+        Bytes past the end of the frame are kept for the next call.
+
+        ### Args
+        - **timeout** (`float`, optional): Maximum time to wait for a complete frame, in seconds. Defaults to 3.
+
+        ### Returns
+        - **str**: Decoded frame without surrounding whitespace.
+
+        ### Raises
+        - **Exception**: If no complete frame arrives before the timeout.
+        """
+
+        deadline = time.monotonic() + timeout
+        while (end := self._rx_buf.find(b"\r\n")) < 0:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([self._fd], [], [], remaining)[0]:
+                raise Exception("Timeout waiting for response")
+
+            chunk = os.read(self._fd, 256)
+            if not chunk:
+                raise Exception("UART closed")
+            self._rx_buf += chunk
+
+        frame = self._rx_buf[:end]
+        del self._rx_buf[:end + 2]
+        return frame.decode().strip()
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: _read
@@ -215,10 +363,24 @@ class PPSAnalyzerDataSource(DataSource):
         """
 
         # Format address as hex string if it's not already
-        addr = f"0x{addr:08X}" if not isinstance(addr, str) else addr
+        return self._read_hex(f"0x{addr:08X}" if not isinstance(addr, str) else addr)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _read_hex
+# ─────────────────────────────────────────────────────────────────────────────
+    def _read_hex(self, addr: str) -> int:
+        """
+        Reads a 32-bit value from an already formatted address.
+
+        ### Args
+        - **addr** (`str`): Address to read from, as a `0xXXXXXXXX` string.
+
+        ### Returns
+        - **int**: Value read from the address, converted from hexadecimal to integer.
+        """
 
         # Send read command and parse the second field of the response
-        return int(self._comm("RC", [addr])[1], 16)
+        return int(self._comm("RC", (addr,))[1], 16)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: _write
@@ -239,8 +401,22 @@ class PPSAnalyzerDataSource(DataSource):
             val = val & 0xFFFFFFFF # Ensure a 32 bits unsigned int
             val = f"0x{val:08X}"
 
+        self._write_hex(addr, val)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _write_hex
+# ─────────────────────────────────────────────────────────────────────────────
+    def _write_hex(self, addr: str, val: str) -> None:
+        """
+        Writes a 32-bit value to an already formatted address.
+
+        ### Args
+        - **addr** (`str`): Target address, as a `0xXXXXXXXX` string.
+        - **val** (`str`): Value to write, as a `0xXXXXXXXX` string.
+        """
+
         # Send write command with address and value
-        self._comm("WC", [addr, val])
+        self._comm("WC", (addr, val))
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: setUp
@@ -254,48 +430,74 @@ class PPSAnalyzerDataSource(DataSource):
         """
 
         # Open UART connection with specified port and settings
-        self.uart = serial.Serial(port=self.port, baudrate=1000000, timeout=3)
+        self._open_uart()
 
         # Clear configuration on the device
         self._comm("CC")
 
-        # Enable each configured TSU and apply cable delay
-        for i in range(len(self.pps_inputs)):
-            self.setEnable(self.pps_inputs[i], True)
-            self._write(
-                self.base_addrs[self.pps_inputs[i]] + self.REG["CABLE_DELAY"],
-                self.cable_delays[i]
-            )
+        # Enable each configured TSU and apply cable delay, all in one batch
+        commands = []
+        for idx, delay in zip(self.pps_inputs, self.cable_delays):
+            commands += self._enable_commands(idx, True)
+            commands.append(("WC", (self._hex_cable_delay[idx], f"0x{delay & 0xFFFFFFFF:08X}")))
+        self._comm_many(commands)
+
+        # Update internal TSU state
+        for idx in self.pps_inputs:
+            self.tsu_state[idx] = True
+            self.enabled_tsus.add(idx)
 
 # ─────────────────────────────────────────────────────────────────────────────
-# 📌 Function: setEnable
+# 📌 Function: _enable_commands
 # ─────────────────────────────────────────────────────────────────────────────
-    def setEnable(self, idx: int, enable: bool) -> None:
+    def _enable_commands(self, idx: int, enable: bool) -> List[tuple[str, tuple[str, ...]]]:
         """
-        Enables or disables a specific TSU (Timestamping Unit).
-
-        Writes to the appropriate registers to activate or deactivate the TSU,
-        configure its interrupt behavior, and update its internal state.
+        Builds the register writes that enable or disable a TSU.
 
         ### Args
         - **idx** (`int`): Index of the TSU to configure.
         - **enable** (`bool`): `True` to enable the TSU, `False` to disable it.
-        """
 
-        base = self.base_addrs[idx]
+        ### Returns
+        - **List[tuple[str, tuple[str, ...]]]**: `(code, fields)` commands for `_comm_many`.
+        """
 
         # Write to the ENABLE register
-        self._write(base + self.REG["ENABLE"], int(enable))
+        commands = [("WC", (self._hex_enable[idx], self.HEX_ONE if enable else self.HEX_ZERO))]
 
         if enable:
             # Enable interrupts for the TSU
-            self._write(base + self.REG["INT_ENABLE"], 1)
+            commands.append(("WC", (self._hex_int_enable[idx], self.HEX_ONE)))
 
             # Clear any pending interrupts
-            self._write(base + self.REG["INT_CLEAR"], 1)
+            commands.append(("WC", (self._hex_int_clear[idx], self.HEX_ONE)))
+
+        return commands
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: setEnable
+# ─────────────────────────────────────────────────────────────────────────────
+    def setEnable(self, idx: int, enable: bool) -> None:
+        """
+        Enables or disables a specific TSU (Timestamping Unit).
+
+        Writes to the appropriate registers to activate or deactivate the TSU,
+        configure its interrupt behavior, and update its internal state.
+
+        ### Args
+        - **idx** (`int`): Index of the TSU to configure.
+        - **enable** (`bool`): `True` to enable the TSU, `False` to disable it.
+        """
+
+        # Write the enable and interrupt registers in one round trip
+        self._comm_many(self._enable_commands(idx, enable))
 
         # Update internal TSU state
         self.tsu_state[idx] = enable
+        if enable:
+            self.enabled_tsus.add(idx)
+        else:
+            self.enabled_tsus.discard(idx)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: hasTimestamp
@@ -311,7 +513,7 @@ class PPSAnalyzerDataSource(DataSource):
         - **bool**: `True` if a timestamp is available, `False` otherwise.
         """
 
-        return self._read(self.base_addrs[idx] + self.REG["INT_CLEAR"]) > 0
+        return self._read_hex(self._hex_int_clear[idx]) > 0
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: getEventCount
@@ -327,7 +529,7 @@ class PPSAnalyzerDataSource(DataSource):
         - **int**: Number of events counted by the TSU.
         """
 
-        return self._read(self.base_addrs[idx] + self.REG["EVENT_COUNT"])
+        return self._read_hex(self._hex_event_count[idx])
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: readTimestamp
@@ -346,16 +548,14 @@ class PPSAnalyzerDataSource(DataSource):
         - **tuple[int, int]**: A tuple containing `(seconds, nanoseconds)`.
         """
 
-        base = self.base_addrs[idx]
+        # Read nanoseconds and seconds, then clear the interrupt flag, in one round trip
+        ns, s, _ = self._comm_many([
+            ("RC", (self._hex_ts_ns[idx],)),
+            ("RC", (self._hex_ts_s[idx],)),
+            ("WC", (self._hex_int_clear[idx], self.HEX_ONE)),
+        ])
 
-        # Read nanoseconds and seconds from the timestamp registers
-        ns = self._read(base + self.REG["TS_NS"])
-        s = self._read(base + self.REG["TS_S"])
-
-        # Clear the interrupt flag after reading the timestamp
-        self._write(base + self.REG["INT_CLEAR"], 1)
-
-        return s, ns
+        return int(s[1], 16), int(ns[1], 16)
 
     
 # ─────────────────────────────────────────────────────────────────────────────
@@ -369,50 +569,72 @@ class PPSAnalyzerDataSource(DataSource):
         detects missed events, and sends metrics for each valid PPS signal.
         """
 
+        # Reduce scheduling jitter of the polling cycle
+        if self.cpu_affinity is not None:
+            self.set_realtime(self.cpu_affinity)
+
         self.setUp()
 
+        # TSUs polled every cycle (not changed while running)
+        active = sorted(self.enabled_tsus)
+
         # Initialize event counters for each active TSU
-        counts = {i: self.getEventCount(i) if self.tsu_state[i] else 0 for i in self.pps_inputs}
+        counts = {i: self.getEventCount(i) for i in active}
 
         # Prime the timestamp registers by reading once
-        for i in self.pps_inputs:
-            if self.tsu_state[i]:
-                self.readTimestamp(i)
+        for i in active:
+            self.readTimestamp(i)
 
         s0 = None
-        start = nextCycle = datetime.now()
-
-        while not self.event.is_set():
-            for i in self.pps_inputs:
-                if self.tsu_state[i]:
-                    has_ts = self.hasTimestamp(i)
-                    if has_ts:
-                        count = self.getEventCount(i)
-
-                        # Detect and report missed timestamps (optional)
-                        if count - counts[i] > 1:
-                            missed = count - counts[i] - 1
-                            #self.send_metric(time.time_ns(), f"missed_timestamps_{i}", missed)
-
-                        counts[i] = count
-
-                        # Read and normalize timestamp
-                        s, ns = self.readTimestamp(i)
-                        if ns > 5e8:
-                            s += 1
-                            ns -= int(1e9)
-
-                        if s0 is None:
-                            s0 = s
-
-                        # Send metric with current timestamp
-                        self.send_metric(time.time_ns(), f"PPS_{i}", ns)
+        next_cycle_ns = time.monotonic_ns()
+
+        # Bind per-cycle callables once for the polling loop
+        comm_many, time_ns, monotonic_ns, send_metric = self._comm_many, time.time_ns, time.monotonic_ns, self.send_metric
+        is_set = self.event.is_set
+
+        while not is_set():
+            # Check every TSU for a pending timestamp in one round trip
+            flags = comm_many([("RC", (self._hex_int_clear[i],)) for i in active]) if active else []
+            ready = [i for i, flag in zip(active, flags) if int(flag[1], 16) > 0]
+
+            if ready:
+                # Read event count and timestamp, then clear the interrupt, of every ready TSU at once
+                commands = []
+                for i in ready:
+                    commands += [
+                        ("RC", (self._hex_event_count[i],)),
+                        ("RC", (self._hex_ts_ns[i],)),
+                        ("RC", (self._hex_ts_s[i],)),
+                        ("WC", (self._hex_int_clear[i], self.HEX_ONE)),
+                    ]
+                replies = comm_many(commands)
+
+                for n, i in enumerate(ready):
+                    count, ns, s = (int(reply[1], 16) for reply in replies[4 * n:4 * n + 3])
+
+                    # Detect and report missed timestamps (optional)
+                    if count - counts[i] > 1:
+                        missed = count - counts[i] - 1
+                        #self.send_metric(time.time_ns(), f"missed_timestamps_{i}", missed)
+
+                    counts[i] = count
+
+                    # Normalize timestamp
+                    if ns > 5e8:
+                        s += 1
+                        ns -= int(1e9)
+
+                    if s0 is None:
+                        s0 = s
+
+                    # Send metric with current timestamp
+                    send_metric(time_ns(), f"PPS_{i}", ns)
 
             # Wait until the next 0.5-second cycle
-            nextCycle += timedelta(seconds=0.5)
-            sleep = (nextCycle - datetime.now()).total_seconds()
-            if sleep > 0:
-                time.sleep(sleep)
+            next_cycle_ns += self.CYCLE_NS
+            sleep_ns = next_cycle_ns - monotonic_ns()
+            if sleep_ns > 0:
+                time.sleep(sleep_ns / 1e9)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: stop
@@ -421,18 +643,18 @@ class PPSAnalyzerDataSource(DataSource):
         """
         Stops the PPS monitoring thread and releases resources.
 
-        Disables all active TSUs, closes the UART connection if open,
-        and calls the parent class's `stop` method.
+        Calls the parent class's `stop` method to end the polling thread, then
+        disables all active TSUs and closes the UART connection if open.
         """
 
+        # Stop the polling thread first, so it is not using the UART concurrently
+        super().stop()
+
         # Disable all enabled TSUs
-        for i in self.enabled_tsus:
+        for i in list(self.enabled_tsus):
             self.setEnable(i, False)
 
         # Close UART connection if open
         if self.uart:
             self.uart.close()
 
-        # Call parent stop method
-        super().stop()
-
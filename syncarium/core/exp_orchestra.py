@@ -15,15 +15,17 @@
 # ─────────────────────────────────────────────────────────────────────────────
 # Standard Library Imports
 
-import yaml
+import os
 import time
-import datetime
 import threading
+import queue
 import logging
-import hashlib
+import secrets
+import functools
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Callable, Optional, Any
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Third-Party Imports
@@ -37,6 +39,26 @@ import syncarium.options.global_vars as global_vars
 import syncarium.options.telegram_vars as telegram_vars
 
 
+# ─────────────────────────────────────────────────────────────
+# 📌 Function: _format_seconds
+# ─────────────────────────────────────────────────────────────
+def _format_seconds(seconds: int) -> str:
+    """
+    Formats a number of seconds as `H:MM:SS`, as `str(datetime.timedelta(...))` does
+    for durations under a day, without building a `timedelta`.
+
+    ### Args:
+    - **seconds** (`int`): Number of seconds to format.
+
+    ### Returns:
+    - **str**: Formatted duration.
+    """
+
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
+
+
 # ─────────────────────────────────────────────────────────────
 # ⚗️ ExpOrchestra Class
 # ─────────────────────────────────────────────────────────────
@@ -51,6 +73,7 @@ class ExpOrchestra:
     - **loadgen** (`LoadGen`): Traffic generator manager.
     - **dataex** (`DataEx`): Data extractor tool instance.
     - **exp_dir** (`Path`): Path to the directory containing experiment definitions.
+    - **_exp_files_cache** (`Optional[tuple[dict[str, int], list[str]]]`): Modification times of the scanned directories and the experiment files found in them.
     - **output_dir** (`Path`): Path to the directory for storing experiment outputs.
     - **state** (`Any`): Current state of the experiment.
     - **fn** (`Optional[str]`): Name of the loaded experiment file.
@@ -65,21 +88,31 @@ class ExpOrchestra:
     - **start_ts** (`Optional[float]`): Timestamp when the experiment starts.
     - **exp_output_dir** (`Optional[Path]`): Path to the specific output directory for the experiment.
     - **logger** (`Any`): Logger instance for logging experiment events.
+    - **experiment_logger** (`logging.Logger`): Logger reused by every experiment run.
+    - **log_listener** (`Optional[QueueListener]`): Background listener writing the logger records to the log file.
+    - **log_lock** (`threading.Lock`): Lock serializing the teardown of the experiment log.
     - **output_log** (`Optional[Path]`): Path to the output log file.
     - **output_yaml** (`Optional[Path]`): Path to the output YAML file.
     - **stl_fn** (`Optional[str]`): Name of the STL script file.
     - **dataex_datasources** (`Any`): Data sources used by the extractor.
     - **synccore_clients** (`Any`): PTP clients involved in the experiment.
+    - **task_schedule** (`List[Tuple[int, Callable[[], None], str]]`): Tasks of the loaded experiment, sorted by start time.
     - **telegram_bot_token** (`str`): Telegram bot token used for sending notifications.
     - **telegram_chat_id** (`str`): Telegram chat ID used for sending notifications.
+    - **telegram_queue** (`queue.SimpleQueue`): Messages pending to be sent to Telegram.
+    - **telegram_thread** (`Optional[threading.Thread]`): Worker thread sending the queued Telegram messages.
     - **thread** (`Optional[threading.Thread]`): Thread handling the experiment execution.
     - **batch_thread** (`Optional[threading.Thread]`): Thread handling batch execution.
     - **stop_event** (`threading.Event`): Event used to signal experiment interruption.
+    - **batch_stop_event** (`threading.Event`): Event used to signal batch interruption.
     - **total_repetitions** (`Optional[int]`): Total number of repetitions in batch mode.
     - **actual_repetition** (`Optional[int]`): Current repetition number in batch mode.
     - **delay_between** (`Optional[int]`): Delay in seconds between repetitions.
+    - **TASK_JOIN_TIMEOUT** (`float`): Seconds a run waits for its task launches to return before finalizing.
     """
 
+    TASK_JOIN_TIMEOUT: float = 10.0
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 🚧 Function: constructor
 # ─────────────────────────────────────────────────────────────────────────────
@@ -120,14 +153,20 @@ class ExpOrchestra:
         self.thread: threading.Thread | None = None
         self.batch_thread: threading.Thread | None = None
         self.stop_event: threading.Event = threading.Event()
+        self.batch_stop_event: threading.Event = threading.Event()
 
         # Directory paths
         self.exp_dir: Path = global_vars.EXPERIMENTS_DIR
+        self._exp_files_cache: Optional[tuple[dict[str, int], list[str]]] = None
         self.output_dir: Path = global_vars.OUTPUT_DIR
         self.exp_output_dir: Optional[Path] = None
 
         # Logging
         self.logger: Any = None
+        self.experiment_logger: logging.Logger = logging.getLogger("syncarium.experiment")
+        self.experiment_logger.setLevel(logging.DEBUG)
+        self.log_listener: Optional[QueueListener] = None
+        self.log_lock: threading.Lock = threading.Lock()
         self.output_log: Optional[Path] = None
         self.output_yaml: Optional[Path] = None
 
@@ -135,6 +174,7 @@ class ExpOrchestra:
         self.stl_fn: Optional[str] = None
         self.dataex_datasources: Any = None
         self.synccore_clients: Any = None
+        self.task_schedule: List[Tuple[int, Callable[[], None], str]] = []
 
         # Timing information
         self.stl_start: Optional[float] = None
@@ -152,6 +192,38 @@ class ExpOrchestra:
         # Telegram notification setup
         self.telegram_bot_token: str = telegram_vars.TELEGRAM_BOT_TOKEN
         self.telegram_chat_id: str = telegram_vars.TELEGRAM_CHAT_ID
+        self.telegram_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.telegram_thread: Optional[threading.Thread] = None
+        if self.telegram_bot_token:
+            self.telegram_thread = threading.Thread(target=self._telegram_worker, daemon=True)
+            self.telegram_thread.start()
+
+        # Main menu entries and the methods they map to, built once
+        self._main_menu_choices: list[dict[str, str]] = [
+            {"name": "⚗️ Load Experiment", "value": "load_experiment"},
+            {"name": "⚗️ Launch Experiment", "value": "launch_experiment"},
+            {"name": "🏭 Launch Experiment Batch", "value": "launch_experiment_batch"},
+            {"name": "🛑⚗️ Stop Experiment", "value": "stop_experiment"},
+            {"name": "🛑🏭 Stop Experiment Batch", "value": "stop_experiment_batch"},
+            {"name": "⏳ Show Progress", "value": "show_progress"},
+            {"name": "📄 Show Experiment Status", "value": "show_experiment"},
+            {"name": "📄 Show Extracted Data", "value": "show_extracted_data"},
+            {"name": "🔄 Refresh view", "value": "refresh_view"},
+            {"name": "❌ Exit", "value": "exit"},
+        ]
+        self._main_menu_dispatch: dict[str, Callable[[], None]] = {
+            "load_experiment":              self.load_experiment,
+            "launch_experiment":            self.launch_experiment_bg,
+            "launch_experiment_batch":      self.launch_experiment_batch,
+            "stop_experiment":              self.stop_experiment,
+            "stop_experiment_batch":        self.stop_experiment_batch,
+            "show_progress":                self.show_progress,
+            "show_experiment":              self.show_experiment,
+            "show_extracted_data":          self.show_extracted_data,
+        }
+
+        # Warm the experiment file cache in the background so the first menu visit finds it ready
+        threading.Thread(target=self._warm_experiment_files, daemon=True).start()
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -205,6 +277,7 @@ class ExpOrchestra:
                 # Show current data extractor status
                 self.vt.table_data_extractor(
                     self.dataex.writer_process,
+                    self.dataex.is_running(),
                     self.dataex.loaded_datasources,
                     self.dataex.output_filepath,
                     self.dataex.start_time,
@@ -230,39 +303,13 @@ class ExpOrchestra:
                 )
 
                 # Display interactive menu and get user choice
-                choice: str = self.vt.console_select_menu(
-                    choices=[
-                        {"name": "⚗️ Load Experiment", "value": "load_experiment"},
-                        {"name": "⚗️ Launch Experiment", "value": "launch_experiment"},
-                        {"name": "🏭 Launch Experiment Batch", "value": "launch_experiment_batch"},
-                        {"name": "🛑⚗️ Stop Experiment", "value": "stop_experiment"},
-                        {"name": "🛑🏭 Stop Experiment Batch", "value": "stop_experiment_batch"},
-                        {"name": "⏳ Show Progress", "value": "show_progress"},
-                        {"name": "📄 Show Experiment Status", "value": "show_experiment"},
-                        {"name": "📄 Show Extracted Data", "value": "show_extracted_data"},
-                        {"name": "🔄 Refresh view", "value": "refresh_view"},
-                        {"name": "❌ Exit", "value": "exit"},
-                    ],
-                    indent=1
-                )
-
-                # Map menu options to corresponding methods
-                submenu: dict[str, Callable[[], None]] = {
-                    "load_experiment":              self.load_experiment,
-                    "launch_experiment":            self.launch_experiment_bg,
-                    "launch_experiment_batch":      self.launch_experiment_batch,
-                    "stop_experiment":              self.stop_experiment,
-                    "stop_experiment_batch":        self.stop_experiment_batch,
-                    "show_progress":                self.show_progress,
-                    "show_experiment":              self.show_experiment,
-                    "show_extracted_data":          self.show_extracted_data,
-                }
+                choice: str = self.vt.console_select_menu(choices=self._main_menu_choices, indent=1)
 
                 # Handle user selection
                 if choice == "exit":
                     break
                 elif choice != "refresh_view":
-                    action = submenu.get(choice)
+                    action = self._main_menu_dispatch.get(choice)
                     if action:
                         action()
                         input("\n🔙 Press ⏎ to return to the menu...")
@@ -272,6 +319,97 @@ class ExpOrchestra:
             self.vt.console_message("exit", "Exiting...")
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _list_experiment_files
+# ─────────────────────────────────────────────────────────────────────────────
+    def _list_experiment_files(self) -> list[str]:
+        """
+        Lists the experiment YAML files under the experiments directory.
+
+        The result is cached together with the modification time of every scanned
+        directory. Adding, removing or renaming a file or folder changes the mtime
+        of its parent directory, so the tree is only walked again when one of them
+        differs; otherwise a single `stat` per directory is enough.
+
+        ### Returns:
+        - **list[str]**: Sorted paths of the YAML files, relative to `exp_dir`. Must not be modified.
+        """
+
+        # Reuse the cached listing if no scanned directory changed
+        if self._exp_files_cache is not None:
+            dir_mtimes, files = self._exp_files_cache
+            try:
+                if all(os.stat(d).st_mtime_ns == mtime for d, mtime in dir_mtimes.items()):
+                    return files
+            except OSError:
+                pass  # A scanned directory disappeared, scan again
+
+        dir_mtimes = {}
+        files = []
+        if self.exp_dir.is_dir():
+            pending: list[str] = [str(self.exp_dir)]
+            while pending:
+                directory = pending.pop()
+                dir_mtimes[directory] = os.stat(directory).st_mtime_ns
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif entry.name.endswith(".yaml") and entry.is_file():
+                            files.append(os.path.relpath(entry.path, self.exp_dir))
+
+        files.sort()
+        self._exp_files_cache = (dir_mtimes, files)
+        return files
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _select_experiment_file
+# ─────────────────────────────────────────────────────────────────────────────
+    def _select_experiment_file(self, files: list[str]) -> str:
+        """
+        Lets the user pick one of the experiment files.
+
+        The selection menu is skipped when there is only one file to choose from.
+
+        ### Args:
+        - **files** (`list[str]`): Experiment file paths, relative to `exp_dir`. Must not be empty.
+
+        ### Returns:
+        - **str**: Selected experiment file path.
+        """
+
+        if len(files) == 1:
+            self.vt.console_message("info", f"Only one experiment available: {files[0]}", indent=1)
+            return files[0]
+
+        # Build selection menu for available experiment files
+        choices = [
+            {"name": f"{i}. 📄 {name}", "value": name}
+            for i, name in enumerate(files, 1)
+        ]
+
+        return self.vt.console_select_menu(
+            choices=choices,
+            message="Available Experiments:",
+            indent=1
+        )
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _warm_experiment_files
+# ─────────────────────────────────────────────────────────────────────────────
+    def _warm_experiment_files(self) -> None:
+        """
+        Fills the experiment file cache, ignoring filesystem errors.
+
+        Meant to run in a background thread; errors are reported again by the
+        menus when they list the files themselves.
+        """
+
+        try:
+            self._list_experiment_files()
+        except OSError:
+            pass
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: load_experiment
 # ─────────────────────────────────────────────────────────────────────────────
@@ -300,11 +438,7 @@ class ExpOrchestra:
             
         else:
             # List YAML files in the experiment directory
-            files: list[str] = [
-                str(f.relative_to(self.exp_dir))
-                for f in self.exp_dir.rglob("*.yaml")
-                if f.is_file()
-            ]
+            files: list[str] = self._list_experiment_files()
 
             # Notify if no experiment files are found
             if not files:
@@ -312,17 +446,7 @@ class ExpOrchestra:
                 return
 
             try:
-                # Build selection menu for available experiment files
-                choices = [
-                    {"name": f"{i}. 📄 {name}", "value": name}
-                    for i, name in enumerate(sorted(files), 1)
-                ]
-
-                selected: str = self.vt.console_select_menu(
-                    choices=choices,
-                    message="Available Experiments:",
-                    indent=1
-                )
+                selected: str = self._select_experiment_file(files)
 
                 # Get full path of the selected file
                 filepath_cfg: Path = self.exp_dir / selected
@@ -333,71 +457,143 @@ class ExpOrchestra:
                 return
 
         try:
-            # Load YAML content from the selected file
-            with filepath_cfg.open('r') as file:
-                data: dict = yaml.safe_load(file)
-
-                # Load experiment metadata
-                self.fn = filepath_cfg.stem
-                self.fn_relative_path = filepath_cfg.relative_to(self.exp_dir)
-                self.fn_absolute_path = Path(filepath_cfg).resolve()
-                self.hash_id = hashlib.md5(str(time.time()).encode()).hexdigest()[:4]
-                self.start_ts = None
-                self.duration = int(data.get("total_duration"))
-                self.state = "Loaded"
-
-                # Prepare output directories
-                relative_folder = filepath_cfg.parent.relative_to(self.exp_dir)
-                self.exp_output_dir = self.output_dir / relative_folder / self.fn
-                self.exp_output_dir.mkdir(parents=True, exist_ok=True)
-
-                # Prepare output file paths
-                self.output_log = self.exp_output_dir / f"{self.fn}_{self.hash_id}.log"
-                self.output_yaml = (self.exp_output_dir / f"{self.fn}_{self.hash_id}.yaml").resolve()
-
-                # Load configuration values
-                self.stl_fn = data.get("loadgen_stl_program")
-                self.dataex_datasources = list(data.get("dataex_datasources", {}).keys())
-                self.synccore_clients = list(data.get("synccore_clients", {}).keys())
-
-                # Load start times and durations
-                self.stl_start = int(data.get("loadgen_stl_start"))
-                self.stl_duration = self.duration - 60
-                self.dataex_start = int(data.get("dataex_start"))
-                self.dataex_duration = self.duration - self.dataex_start
-                self.synccore_start = int(data.get("synccore_start"))
-                self.synccore_stop_at_end = bool(data.get("synccore_stop_at_end"))
+            # Load YAML content from the selected file (re-parsed only when the file changes,
+            # so batch repetitions and the data source loader reuse it)
+            self.fn_absolute_path = filepath_cfg.resolve()
+            data: dict = utils.parse_config(str(self.fn_absolute_path), self.fn_absolute_path.stat().st_mtime_ns)
+
+            # Load experiment metadata
+            self.fn = filepath_cfg.stem
+            self.fn_relative_path = filepath_cfg.relative_to(self.exp_dir)
+            self.hash_id = secrets.token_hex(2)
+            self.start_ts = None
+            self.duration = int(data.get("total_duration"))
+            self.state = "Loaded"
+
+            # Prepare output directories
+            self.exp_output_dir = self.output_dir / self.fn_relative_path.parent / self.fn
+            self.exp_output_dir.mkdir(parents=True, exist_ok=True)
+
+            # Prepare output file paths
+            self.output_log = self.exp_output_dir / f"{self.fn}_{self.hash_id}.log"
+            self.output_yaml = (self.exp_output_dir / f"{self.fn}_{self.hash_id}.yaml").resolve()
+
+            # Load configuration values
+            self.stl_fn = data.get("loadgen_stl_program")
+            self.dataex_datasources = list(data.get("dataex_datasources", {}).keys())
+            self.synccore_clients = list(data.get("synccore_clients", {}).keys())
+
+            # Load start times and durations
+            self.stl_start = int(data.get("loadgen_stl_start"))
+            self.stl_duration = self.duration - 60
+            self.dataex_start = int(data.get("dataex_start"))
+            self.dataex_duration = self.duration - self.dataex_start
+            self.synccore_start = int(data.get("synccore_start"))
+            self.synccore_stop_at_end = bool(data.get("synccore_stop_at_end"))
+            self.task_schedule = self._build_task_schedule()
+
+            # Data sources do not depend on PTP, load them while PTP clients are reloaded
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                datasources = executor.submit(self.dataex.load_datasources, file_cfg=self.fn_absolute_path, quiet=True)
 
                 # If PTP enabled, kill actual clients and load new PTP clients
                 if self.synccore_start != -1:
                     self.synccore.stop_ptp(preconfirmation=True, quiet=True)
                     self.synccore.load_clients(file_cfg=self.fn_absolute_path, logger=self.logger, extra_indent=1, quiet=True)
 
-                # Load datasources
-                self.dataex.load_datasources(file_cfg=self.fn_absolute_path, quiet = True)
+                datasources.result()
 
-                # Display experiment summary
-                if not quiet: 
-                    self.vt.console_message("success", "Experiment loaded successfully.", indent=1)
-                    self.vt.console_message("info", f"Experiment Name: {self.fn}", indent=2)
-                    self.vt.console_message("info", f"dataex Datasources: {self.dataex_datasources} | Starting at: {str(datetime.timedelta(seconds=self.dataex_start))}", indent=2)
-                    if self.synccore_start != -1:
-                        self.vt.console_message("info", f"PTP Clients: {self.synccore_clients} | Starting at: {str(datetime.timedelta(seconds=self.synccore_start))}", indent=2)
-                    if self.stl_start != -1:
-                        self.vt.console_message("info", f"STL Program: {self.stl_fn} | Starting at: {str(datetime.timedelta(seconds=self.stl_start))}", indent=2)
-                    self.vt.console_message("info", f"Total duration: {int(self.duration / 60)} min | Data duration: {int(self.dataex_duration / 60)} min", indent=2)
+            # Display experiment summary
+            if not quiet: 
+                self.vt.console_message("success", "Experiment loaded successfully.", indent=1)
+                self.vt.console_message("info", f"Experiment Name: {self.fn}", indent=2)
+                self.vt.console_message("info", f"dataex Datasources: {self.dataex_datasources} | Starting at: {_format_seconds(self.dataex_start)}", indent=2)
+                if self.synccore_start != -1:
+                    self.vt.console_message("info", f"PTP Clients: {self.synccore_clients} | Starting at: {_format_seconds(self.synccore_start)}", indent=2)
+                if self.stl_start != -1:
+                    self.vt.console_message("info", f"STL Program: {self.stl_fn} | Starting at: {_format_seconds(self.stl_start)}", indent=2)
+                self.vt.console_message("info", f"Total duration: {int(self.duration / 60)} min | Data duration: {int(self.dataex_duration / 60)} min", indent=2)
 
         except Exception as e:
             # Handle errors during file reading or parsing
             self.vt.console_message("error", f"Error reading YAML file: {e}", indent=1)
             self.clean_experiment()
 
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _build_task_schedule
+# ─────────────────────────────────────────────────────────────────────────────
+    def _build_task_schedule(self) -> List[Tuple[int, Callable[[], None], str]]:
+        """
+        Builds the tasks of the loaded experiment, sorted by their scheduled start time.
+
+        Called once per load, so `launch_experiment` only has to walk the schedule.
+
+        ### Returns:
+        - **List[Tuple[int, Callable[[], None], str]]**: Start time in seconds, task and name of each task.
+        """
+
+        # Bind the loaded configuration now, so pending tasks are not affected if
+        # the experiment is cleaned or reloaded while they wait
+        dataex_start, synccore_start, stl_start = self.dataex_start, self.synccore_start, self.stl_start
+        suffix_out, exp_output_dir, dataex_duration = f"{self.fn}_{self.hash_id}", self.exp_output_dir, self.dataex_duration
+        fn_absolute_path, stl_duration, output_yaml = self.fn_absolute_path, self.stl_duration, self.output_yaml
+        logger = self.experiment_logger
+
+        # Define tasks with their scheduled start times
+        tasks: List[Tuple[int, Callable[[], None], str]] = [
+            (
+                dataex_start,
+                functools.partial(
+                    self.dataex.start_extraction,
+                    suffix_out=suffix_out,
+                    dir_out=exp_output_dir,
+                    duration_out=dataex_duration,
+                    logger=logger,
+                    extra_indent=1
+                ),
+                "dataex"
+            )
+        ]
+
+        # Include PTP task if configured
+        if synccore_start != -1:
+            tasks.append((
+                synccore_start,
+                functools.partial(
+                    self.synccore.start_ptp,
+                    logger=logger,
+                    extra_indent=1,
+                    stop = False
+                ),
+                "PTP"
+            ))
+
+        # Include STL task if configured
+        if stl_start != -1:
+            tasks.append((
+                stl_start,
+                functools.partial(
+                    self.loadgen.start_stl_program,
+                    fn_absolute_path,
+                    stl_duration,
+                    output_yaml,
+                    logger=logger,
+                    extra_indent=1
+                ),
+                "STL"
+            ))
+
+        # Sort tasks by their scheduled start time
+        tasks.sort(key=lambda x: x[0])
+
+        return tasks
+
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: interrupted_sleep
 # ─────────────────────────────────────────────────────────────────────────────
-    def interrupted_sleep(self, seconds: float, stop_event: threading.Event) -> None:
+    def interrupted_sleep(self, seconds: float, stop_event: threading.Event) -> bool:
         """
-        Sleeps in small intervals to allow interruption via a stop event.
+        Sleeps until the given time elapses or the stop event is set, whichever comes first.
 
         This method is useful for long-running operations that need to be interruptible,
         such as experiment delays or scheduled actions.
@@ -405,15 +601,36 @@ class ExpOrchestra:
         ### Args:
         - **seconds** (`float`): Total duration to sleep.
         - **stop_event** (`threading.Event`): Event used to interrupt the sleep early.
+
+        ### Returns:
+        - **bool**: `True` if the sleep was interrupted by the stop event, `False` otherwise.
         """
 
-        interval: float = 0.5
-        elapsed: float = 0.0
-        while elapsed < seconds:
-            if stop_event.is_set():
-                break
-            time.sleep(min(interval, seconds - elapsed))
-            elapsed += interval
+        return stop_event.wait(timeout=seconds)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: close_experiment_log
+# ─────────────────────────────────────────────────────────────────────────────
+    def close_experiment_log(self) -> None:
+        """
+        Detaches the log handlers of the last experiment run.
+
+        Stops the log listener, which writes any pending records, and closes the
+        log file so the experiment logger can be reused by the next run.
+        """
+
+        # The finished run and a new load can close the log at the same time,
+        # make sure the listener is only stopped once
+        with self.log_lock:
+            listener, self.log_listener = self.log_listener, None
+            if listener:
+                listener.stop()
+                for handler in listener.handlers:
+                    handler.close()
+
+            for handler in self.experiment_logger.handlers[:]:
+                self.experiment_logger.removeHandler(handler)
+                handler.close()
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: launch_experiment_bg
@@ -422,7 +639,7 @@ class ExpOrchestra:
         """
         Starts the experiment in a background thread and sets up logging.
 
-        Initializes a timestamped logger with a rotating file handler, then launches
+        Attaches a rotating file handler for this run to the experiment logger, then launches
         the experiment asynchronously using a daemon thread. Any exceptions during
         execution are logged automatically.
 
@@ -435,17 +652,20 @@ class ExpOrchestra:
         # Notify user that experiment is starting
         if not quiet: self.vt.console_message("title", "Starting Experiment", "⚗️")
 
-        # Create and configure logger
-        timestamp: str = time.strftime('%d-%m-%Y_%H:%M:%S')
-        self.logger = logging.getLogger(f"experiment_logger_{timestamp}")
-        self.logger.setLevel(logging.DEBUG)
+        # Reuse the experiment logger, replacing the handlers of any previous run
+        self.close_experiment_log()
+        self.logger = self.experiment_logger
+
+        # Add rotating file handler for this run. Records are queued and
+        # written by a background listener, so logging never blocks the experiment
+        handler = RotatingFileHandler(self.output_log, maxBytes=5_000_000, backupCount=3)
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
 
-        # Add rotating file handler if not already present
-        if not self.logger.handlers:
-            handler = RotatingFileHandler(self.output_log, maxBytes=5_000_000, backupCount=3)
-            formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
-            handler.setFormatter(formatter)
-            self.logger.addHandler(handler)
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.logger.addHandler(QueueHandler(log_queue))
+        self.log_listener = QueueListener(log_queue, handler)
+        self.log_listener.start()
 
         def thread_target() -> None:
             """
@@ -456,6 +676,11 @@ class ExpOrchestra:
                 self.launch_experiment()
             except Exception:
                 self.logger.exception("Experiment failed with an exception")
+            finally:
+                # A finished run has nothing left to log, release its log file now.
+                # Stopped runs keep it open for the messages of stop_experiment
+                if self.state == "Finished":
+                    self.close_experiment_log()
 
         # Launch the experiment in a background thread
         self.stop_event.clear()
@@ -493,56 +718,29 @@ class ExpOrchestra:
 
         # Update internal state and record start time
         self.state = "Running"
-        start_time: float = time.time()
-        self.start_ts = start_time
+        self.start_ts = time.time()
 
-        # Define tasks with their scheduled start times
-        tasks: List[Tuple[int, Callable[[], None], str]] = [
-            (
-                self.dataex_start,
-                lambda: self.dataex.start_extraction(
-                    suffix_out=f"{self.fn}_{self.hash_id}",
-                    dir_out=self.exp_output_dir,
-                    duration_out=self.dataex_duration,
-                    logger=self.logger,
-                    extra_indent=1
-                ),
-                "dataex"
-            )
-        ]
-
-        # Include PTP task if configured
-        if self.synccore_start != -1:
-            tasks.append((
-                self.synccore_start,
-                lambda: self.synccore.start_ptp(
-                    logger=self.logger,
-                    extra_indent=1,
-                    stop = False
-                ),
-                "PTP"
-            ))
+        # Schedule on the monotonic clock, immune to steps of the (PTP-disciplined) wall clock
+        start_time: float = time.monotonic()
 
-        # Include STL task if configured
-        if self.stl_start != -1:
-            tasks.append((
-                self.stl_start,
-                lambda: self.loadgen.start_stl_program(
-                    self.fn_absolute_path,
-                    self.stl_duration,
-                    self.output_yaml,
-                    logger=self.logger,
-                    extra_indent=1
-                ),
-                "STL"
-            ))
+        # Tasks were bound to the loaded configuration by load_experiment, so pending
+        # ones are not affected if the experiment is cleaned or reloaded while they wait
+        tasks: List[Tuple[int, Callable[[], None], str]] = self.task_schedule
 
-        # Sort tasks by their scheduled start time
-        tasks.sort(key=lambda x: x[0])
+        def run_task(func: Callable[[], None], name: str) -> None:
+            """
+            Runs a scheduled task and reports any error it raises.
+            """
+            try:
+                func()
+            except Exception as e:
+                self.vt.console_message("error", f"Error launching {name}: {e}", indent=1, logger=self.logger)
 
-        # Execute tasks sequentially with appropriate delays
+        # Launch each task on its own thread at its scheduled time, so a slow
+        # task does not delay the ones scheduled after it
+        launched: List[threading.Thread] = []
         for delay, func, name in tasks:
-            now: float = time.time()
+            now: float = time.monotonic()
             wait_time: float = delay - (now - start_time)
             if wait_time > 0:
                 self.vt.console_message("info", f"Waiting {int(wait_time)}s to start {name}...", indent=1, logger=self.logger)
@@ -553,19 +751,27 @@ class ExpOrchestra:
                 break
 
             self.vt.console_message("info", f"Launching {name}...", indent=1, logger=self.logger)
-            try:
-                func()
-            except Exception as e:
-                self.vt.console_message("error", f"Error launching {name}: {e}", indent=1, logger=self.logger)
+            task = threading.Thread(target=run_task, args=(func, name), name=name, daemon=True)
+            task.start()
+            launched.append(task)
 
         if not self.stop_event.is_set():
             # Notify user of experiment duration
             self.vt.console_message("info", f"Experiment will run for {int(self.dataex_duration)} seconds.", indent=1, logger=self.logger)
 
         # Wait for the experiment to complete
-        remaining: float = self.duration - (time.time() - start_time)
+        remaining: float = self.duration - (time.monotonic() - start_time)
         if remaining > 0:
             self.interrupted_sleep(remaining, self.stop_event)
+
+        # Give launched tasks a bounded grace period to return, also when stopped:
+        # stop_experiment waits for this thread before tearing the components down,
+        # so a start still in progress would otherwise outlive its stop
+        deadline: float = time.monotonic() + self.TASK_JOIN_TIMEOUT
+        for task in launched:
+            task.join(timeout=max(0.0, deadline - time.monotonic()))
+            if task.is_alive():
+                self.vt.console_message("caution", f"{task.name} launch is still running.", indent=1, logger=self.logger)
         
         # Finalize experiment
         if self.stop_event.is_set():
@@ -606,7 +812,7 @@ class ExpOrchestra:
 
         For each repetition, the experiment is reloaded to regenerate a unique ID and output paths.
         A delay is applied between each execution. The batch runs asynchronously in a daemon thread
-        and can be interrupted via `stop_event`.
+        and can be interrupted via `batch_stop_event`.
 
         The user is prompted to configure:
         - Number of repetitions
@@ -616,21 +822,12 @@ class ExpOrchestra:
         # Ask user for number of repetitions and delay
         self.vt.console_message("title", "Batch Configuration", "⚙️")
 
-        files: list[str] = [
-            str(f.relative_to(self.exp_dir))
-            for f in self.exp_dir.rglob("*.yaml")
-            if f.is_file()
-        ]
+        files: list[str] = self._list_experiment_files()
         if not files:
             self.vt.console_message("error", f"No experiment files found in '{self.exp_dir}'.", indent=1)
             return
         try:
-            choices = [{"name": f"{i}. 📄 {name}", "value": name} for i, name in enumerate(sorted(files), 1)]
-            selected: str = self.vt.console_select_menu(
-                choices=choices,
-                message="Available Experiments:",
-                indent=1
-            )
+            selected: str = self._select_experiment_file(files)
             filepath_cfg: Path = selected
         except KeyboardInterrupt:
             self.vt.console_message("caution", "Operation cancelled by user.")
@@ -645,15 +842,14 @@ class ExpOrchestra:
         # Notify via Telegram
         self.notify_telegram_bot(message=f"🏭 Starting a batch of the experiment {selected}, {self.total_repetitions} repetitions and {self.delay_between} seconds between experiments.")
         
-        def batch_runner(stop_event: threading.Event) -> None:
+        def batch_runner() -> None:
+            stop_event: threading.Event = self.batch_stop_event
+
             for i in range(self.total_repetitions):
                 if stop_event.is_set():
                     break
 
                 self.clean_experiment(quiet=True)
-                if stop_event.is_set():
-                    break
-
                 self.load_experiment(filepath_cfg, quiet=True)
                 if stop_event.is_set():
                     break
@@ -662,13 +858,12 @@ class ExpOrchestra:
                 if stop_event.is_set():
                     break
 
-                if i < self.total_repetitions - 1:
-                    for _ in range(int(self.duration + self.delay_between)):
-                        if stop_event.is_set():
-                            break
-                        time.sleep(1)
+                # Wait for the experiment and the delay, waking up at once if stopped
+                if i < self.total_repetitions - 1 and stop_event.wait(self.duration + self.delay_between):
+                    break
 
-        self.batch_thread = threading.Thread(target=lambda: batch_runner(self.stop_event), daemon=True)
+        self.batch_stop_event.clear()
+        self.batch_thread = threading.Thread(target=batch_runner, daemon=True)
         self.batch_thread.start()
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -687,8 +882,7 @@ class ExpOrchestra:
         """
 
         # Display section title
-        self.vt.console_message("title", "Stopping/Cleaning Experiment", "🛑", indent=extra_indent, logger=self.logger)
-        self.vt.console_message("title", "Stopping/Cleaning Experiment", "🛑", indent=extra_indent)
+        self.vt.console_message("title", "Stopping/Cleaning Experiment", "🛑", indent=extra_indent, logger=self.logger, echo=True)
 
 
         # Check if an experiment is currently running
@@ -697,7 +891,11 @@ class ExpOrchestra:
             return
 
         errors: List[str] = []
+
+        # Wake the experiment thread and let it finish, including the grace period it
+        # gives to task launches still in progress, before tearing down its components
         self.stop_event.set()
+        self.thread.join(timeout=self.TASK_JOIN_TIMEOUT + 5)
 
         # Attempt to stop PTP component if it was configured
         if self.synccore_start != -1:
@@ -722,15 +920,12 @@ class ExpOrchestra:
         # Report any errors encountered during shutdown
         if errors:
             for err in errors:
-                self.vt.console_message("error", f"Error stopping component: {err}", indent=1, logger=self.logger)
-                self.vt.console_message("error", f"Error stopping component: {err}", indent=1)
-                return
+                self.vt.console_message("error", f"Error stopping component: {err}", indent=1, logger=self.logger, echo=True)
+            return
             
         # Update experiment state
-        self.thread.join(timeout=5)
         self.state = "Stopped"
-        self.vt.console_message("success", "All experiment components stopped successfully.", logger=self.logger)
-        self.vt.console_message("success", "All experiment components stopped successfully.", indent=extra_indent)
+        self.vt.console_message("success", "All experiment components stopped successfully.", indent=extra_indent, logger=self.logger, echo=True)
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📌 Function: stop_experiment_batch
@@ -739,7 +934,7 @@ class ExpOrchestra:
         """
         Stops all running experiments in the current batch.
 
-        Signals the stop event to interrupt any ongoing or scheduled experiment launches.
+        Signals the batch stop event to interrupt any scheduled experiment launches.
         Also calls `stop_experiment()` to clean up the currently running experiment, and
         waits for the batch thread to finish execution.
 
@@ -749,16 +944,17 @@ class ExpOrchestra:
         - **extra_indent** (`int`): Indentation level for console messages. Defaults to `0`.
         """
 
-        # Signal to stop all threads
-        self.stop_event.set()
+        # Signal the batch runner to stop launching repetitions
+        self.batch_stop_event.set()
 
         # Stop the currently running experiment
         self.stop_experiment(extra_indent=extra_indent)
 
         self.vt.console_message("title", "Stopping Experiment Batch", "🛑", indent=extra_indent)
         
-        # Stop entire batch
-        self.batch_thread.join()
+        # Stop entire batch, the runner wakes up at once from its wait
+        if self.batch_thread:
+            self.batch_thread.join(timeout=5)
 
         self.vt.console_message("success", "Batch stop signal sent.", indent=extra_indent)
 
@@ -821,7 +1017,7 @@ class ExpOrchestra:
         """
 
         # Check if data extraction process is alive
-        if not self.dataex.writer_process.is_alive():
+        if not self.dataex.is_running():
             self.vt.console_message("caution", "No data extraction was started.", indent=1)
             return
 
@@ -854,7 +1050,8 @@ class ExpOrchestra:
             self.start_ts = None
             self.duration = None
 
-            # Reset logging and output paths
+            # Reset logging and output paths, writing any pending log records
+            self.close_experiment_log()
             self.logger = None
             self.exp_output_dir = None
             self.output_log = None
@@ -870,6 +1067,7 @@ class ExpOrchestra:
             self.synccore_clients = None
             self.synccore_start = None
             self.synccore_stop_at_end = None
+            self.task_schedule = []
             
             # Notify user
             if not quiet: self.vt.console_message("success", "Laboratory cleaned.", indent=1)
@@ -880,25 +1078,69 @@ class ExpOrchestra:
 # ─────────────────────────────────────────────────────────────────────────────
     def notify_telegram_bot(self, message: str) -> None:
         """
-        Sends a message to the configured Telegram bot.
+        Queues a message for the configured Telegram bot.
 
-        Constructs and sends a POST request to the Telegram Bot API using the stored
-        bot token and chat ID. If the request fails, an error message is shown in the console.
+        Messages are sent in order by a background worker, so the experiment
+        never waits for the HTTPS round trip.
 
         ### Args:
         - **message** (`str`): Text message to send via Telegram.
         """
 
         if self.telegram_bot_token:
-            url: str = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+            self.telegram_queue.put(message)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: close
+# ─────────────────────────────────────────────────────────────────────────────
+    def close(self, timeout: float = 15.0) -> None:
+        """
+        Sends the pending Telegram notifications before the application exits.
+
+        Queues a sentinel behind the pending messages and waits for the worker
+        to deliver them and return.
+
+        ### Args:
+        - **timeout** (`float`): Maximum seconds to wait for the worker. Defaults to `15.0`.
+        """
+
+        if self.telegram_thread and self.telegram_thread.is_alive():
+            self.telegram_queue.put(None)
+            self.telegram_thread.join(timeout=timeout)
+
+# ─────────────────────────────────────────────────────────────────────────────
+# 📌 Function: _telegram_worker
+# ─────────────────────────────────────────────────────────────────────────────
+    def _telegram_worker(self) -> None:
+        """
+        Sends the queued messages to the Telegram bot, one at a time.
+
+        Constructs and sends a POST request to the Telegram Bot API using the stored
+        bot token and chat ID, over a session reused for every message. If the request
+        fails, an error message is shown in the console. Returns when `close` queues `None`.
+        """
+
+        url: str = f"https://api.telegram.org/bot{self.telegram_bot_token}/sendMessage"
+
+        # Keep the connection to the API alive between notifications
+        session = requests.Session()
+
+        while True:
+            message: Optional[str] = self.telegram_queue.get()
+            if message is None:
+                break
+
             data: dict[str, str] = {
                 "chat_id": self.telegram_chat_id,
                 "text": message
             }
 
-            response = requests.post(url, data=data)
+            try:
+                response = session.post(url, data=data, timeout=10)
+            except requests.RequestException as e:
+                self.vt.console_message("error", f"Error sending message: {e}")
+                continue
 
             # Handle failed request
             if response.status_code != 200:
                 self.vt.console_message("error", f"Error sending message: {response.text}")
-
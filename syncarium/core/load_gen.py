@@ -567,8 +567,7 @@ class LoadGen:
 
         # Read configuration file
         self.vt.console_message("info", "Reading configuration file...", indent=1 + extra_indent, logger=logger)
-        with open(filepath_cfg, 'r') as f:
-            stl: Dict = yaml.safe_load(f)
+        stl: Dict = utils.parse_config(str(filepath_cfg), Path(filepath_cfg).stat().st_mtime_ns)
 
         self.stl_filename: Optional[str] = stl.get("loadgen_stl_program")
 
@@ -17,7 +17,6 @@
 import os
 import time
 import subprocess
-import yaml
 import re
 import psutil
 from pathlib import Path
@@ -215,10 +214,10 @@ class SyncCore:
                 return False
         
         try:
-            # Load YAML data
-            with open(filepath_cfg, 'r') as f:
-                yaml_data: Dict = yaml.safe_load(f)
-                self.loaded_clients: Dict[str, Dict[str, str]] = yaml_data.get("ptp_clients", {})
+            # Load YAML data (libyaml-backed, cached across experiment repetitions)
+            yaml_data: Dict = utils.parse_config(str(filepath_cfg), Path(filepath_cfg).stat().st_mtime_ns)
+            # Copy: skipped clients are deleted below and the parsed data is shared
+            self.loaded_clients: Dict[str, Dict[str, str]] = dict(yaml_data.get("ptp_clients", {}))
 
             # Get currently existing namespaces
             ns_result = subprocess.run(["ip", "netns", "list"], stdout=subprocess.PIPE, text=True)
@@ -15,7 +15,6 @@
 # ─────────────────────────────────────────────────────────────────────────────
 # Standard Library Imports
 import sys
-import platform
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Third-Party Imports
@@ -37,7 +36,7 @@ def check_os():
 
     This function is useful for ensuring that a script only runs in a Linux environment.
     """
-    if platform.system() != "Linux":
+    if not sys.platform.startswith("linux"):
         print("This script can only be run on Linux.")
         sys.exit(1)
 
@@ -51,7 +50,7 @@ def launch_tui():
     This function imports and executes the main entry point of the TUI
     application, which is implemented using the Rich library.
     """
-    from syncarium import TuiApp
+    from syncarium.tui import TuiApp
     tui = TuiApp()
     tui.main()
 
@@ -172,6 +172,9 @@ class TuiApp:
         # Stop data extraction process
         self.dataex.stop_extraction()
 
+        # Deliver pending experiment notifications
+        self.exporchestra.close()
+
         # Optional cleanup steps (currently disabled)
         # self.synccore.stop_ptp()
         # self.platinit.stop_namespaces()
@@ -98,7 +98,8 @@ class ViewTools:
         message: str,
         title_emoji: str = "🔷",
         indent: int = 0,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        echo: bool = False
     ) -> None:
         """
         Displays a styled message in the console with optional indentation and logging.
@@ -112,6 +113,7 @@ class ViewTools:
         - **title_emoji** (`str`): Emoji used for title-type messages. Defaults to `"🔷"`.
         - **indent** (`int`): Indentation level for visual hierarchy. Defaults to `0`.
         - **logger** (`Optional[Logger]`): Logger instance to log the plain-text message. Defaults to `None`.
+        - **echo** (`bool`): If `True`, the message is also printed when it is logged. Defaults to `False`.
         """
 
         # Define styles and emojis for different message types
@@ -132,13 +134,7 @@ class ViewTools:
         # Create visual indentation prefix
         prefix = "" if indent == 0 else "│   " * (indent - 1) + "├── "
 
-        # Format each line with style and indentation
         lines = message.split("\n")
-        formatted_lines = [
-            f"{prefix}{emoji} {style}{line}{style.replace('[', '[/')}"
-            for line in lines
-        ]
-        formatted_message = "\n".join(formatted_lines)
 
         if logger:
             # Log plain text version if logger is provided
@@ -146,7 +142,15 @@ class ViewTools:
             plain_message = "\n".join(plain_lines)
             log_func = getattr(logger, type.lower(), logger.info)
             log_func(plain_message)
-        else:
+
+        if not logger or echo:
+            # Format each line with style and indentation
+            formatted_lines = [
+                f"{prefix}{emoji} {style}{line}{style.replace('[', '[/')}"
+                for line in lines
+            ]
+            formatted_message = "\n".join(formatted_lines)
+
             # Print styled message to console
             self.console.print(formatted_message)
 
@@ -908,7 +912,8 @@ class ViewTools:
 # ─────────────────────────────────────────────────────────────────────────────
     def table_data_extractor(
         self,
-        writer_process: multiprocessing.Process,
+        writer_process: Optional[multiprocessing.Process],
+        running: bool,
         data_sources: List[dict],
         output_file: str,
         start_time: float,
@@ -917,18 +922,19 @@ class ViewTools:
         """
         Displays a table summarizing the current status of the data extraction process.
 
-        Checks if the writer process is alive and, if so, prints a table showing its PID,
-        output file, start time, duration, and the names of the data sources involved.
+        If the writer process is running, prints a table showing its PID, output file,
+        start time, duration, and the names of the data sources involved.
 
         ### Args
-        - **writer_process** (`multiprocessing.Process`): Process handling data writing.
+        - **writer_process** (`Optional[multiprocessing.Process]`): Process handling data writing, or `None` if never started.
+        - **running** (`bool`): Whether the writer process is alive, as already checked by the caller.
         - **data_sources** (`List[dict]`): List of data source configurations.
         - **output_file** (`str`): Path to the output file.
         - **start_time** (`float`): Timestamp when the extraction started.
         - **duration** (`int`): Duration of the extraction in seconds.
         """
     
-        if not writer_process.is_alive():
+        if writer_process is None or not running:
             # Show a warning if the process is not running
             self.console.print(Panel.fit(
                 "[bold yellow]No extraction process alive.[/bold yellow]",
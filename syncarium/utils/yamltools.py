@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+# yamltools.py
+
+**Project**: Syncarium - Intelligent Timing Platform Toolkit  
+**Description**: Cached YAML configuration loading.  
+**Author**: PhD Student Alberto Ortega Ruiz, University of Granada  
+**Created**: 2026-10-15  
+**Version**: 1.2.0  
+**License**: GPLv3
+"""
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Standard Library Imports
+import functools
+from typing import Dict, Any
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Third-Party Imports
+import yaml
+
+# Prefer the libyaml C loader, falling back to the pure-Python implementation
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Local Application Imports
+# (None used directly in this file)
+
+# ─────────────────────────────────────────────────────────────
+# 📌 Function: parse_config
+# ─────────────────────────────────────────────────────────────
+@functools.lru_cache(maxsize=16)
+def parse_config(filepath: str, mtime_ns: int) -> Dict[str, Any]:
+    """
+    Parses a YAML configuration file, memoized on its path and modification time.
+
+    Editing the file changes `mtime_ns`, so stale entries are never returned.
+    The returned dictionary is shared between calls and must not be mutated.
+
+    ### Args
+    - **filepath** (`str`): Path to the YAML configuration file.
+    - **mtime_ns** (`int`): Modification time of the file in nanoseconds.
+
+    ### Returns
+    - **Dict[str, Any]**: Parsed YAML content (empty if the file is empty).
+    """
+    with open(filepath, 'r') as file:
+        return yaml.load(file, Loader=YamlLoader) or {}